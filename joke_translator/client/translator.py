@@ -3,19 +3,80 @@ Module for handling joke translations using various translation services.
 """
 
 import os
+import time
 import asyncio
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import openai
-from typing import Optional
+from typing import Optional, Union
 import deepl
+from requests.adapters import HTTPAdapter
+
+from joke_translator.utils.translation_table import TranslationTable
+
+# urllib3 keeps at most this many connections per host unless told otherwise
+DEFAULT_POOL_SIZE = 10
+
+def _io_limit(value: Optional[Union[int, float]], env_var: str, default: str, minimum: float, cast=int):
+    """Resolve an I/O limit from an argument or the environment and validate it."""
+    if value is None:
+        value = cast(os.getenv(env_var, default))
+    if value < minimum:
+        raise ValueError(f"{env_var} must be at least {minimum}, got {value}")
+    return value
 
 class TranslatorService:
     """Handles translations using various translation services."""
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        translation_table: Optional[TranslationTable] = None
+    ):
+        # Precomputed translations, checked with lookup() before calling a provider
+        self.translation_table = translation_table
+        
+        # I/O limits, overridable through the environment
+        self.max_workers = _io_limit(max_workers, "TRANSLATOR_MAX_WORKERS", "8", 1)
+        self.max_connections = _io_limit(max_connections, "TRANSLATOR_MAX_CONNECTIONS", "20", 1)
+        self.max_keepalive_connections = _io_limit(
+            max_keepalive_connections, "TRANSLATOR_MAX_KEEPALIVE_CONNECTIONS", "10", 1
+        )
+        self.keepalive_expiry = _io_limit(keepalive_expiry, "TRANSLATOR_KEEPALIVE_EXPIRY", "30", 0, cast=float)
+        # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+        self.http2 = importlib.util.find_spec("h2") is not None
+        
+        self.stats = {
+            "gpt_calls": 0,
+            "gpt_errors": 0,
+            "deepl_calls": 0,
+            "deepl_errors": 0,
+            "table_hits": 0,
+            "warmed_up": False,
+            "warm_up_time": None
+        }
+        
+        # Shared keep-alive connection pool for the OpenAI client
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry
+            ),
+            http2=self.http2
+        )
+        
         # Initialize OpenAI client if API key is available
         openai_key = os.getenv("OPENAI_API_KEY")
         print(f"Initializing OpenAI client with key: {'present' if openai_key else 'missing'}")
-        self.gpt_client = openai.AsyncOpenAI(api_key=openai_key) if openai_key else None
+        self.gpt_client = (
+            openai.AsyncOpenAI(api_key=openai_key, http_client=self.http_client)
+            if openai_key else None
+        )
         if not self.gpt_client:
             print("Failed to initialize OpenAI client - missing API key")
         
@@ -25,6 +86,73 @@ class TranslatorService:
         self.deepl_client = deepl.Translator(deepl_key) if deepl_key else None
         if not self.deepl_client:
             print("Failed to initialize DeepL client - missing API key")
+        else:
+            self._size_deepl_pool()
+        
+        # Dedicated thread pool for the synchronous DeepL SDK, so DeepL calls
+        # don't compete with everything else on the default executor
+        self.deepl_executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="deepl"
+        )
+    
+    def _size_deepl_pool(self):
+        """Give the DeepL SDK's requests session one pooled connection per worker."""
+        # The SDK doesn't expose its session, so reach into its HTTP client
+        session = getattr(getattr(self.deepl_client, "_client", None), "_session", None)
+        if session is not None:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        elif self.max_workers > DEFAULT_POOL_SIZE:
+            # Extra workers would open throwaway connections beyond the default pool
+            print(f"Capping DeepL workers at {DEFAULT_POOL_SIZE}, the SDK's connection pool size")
+            self.max_workers = DEFAULT_POOL_SIZE
+    
+    async def warm_up(self):
+        """Open provider connections ahead of the first translation."""
+        start_time = time.time()
+        tasks = []
+        if self.gpt_client:
+            tasks.append(self.gpt_client.models.list())
+        if self.deepl_client:
+            loop = asyncio.get_running_loop()
+            tasks.append(loop.run_in_executor(self.deepl_executor, self.deepl_client.get_usage))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error warming up translation connections: {result}")
+        
+        self.stats["warmed_up"] = True
+        self.stats["warm_up_time"] = round(time.time() - start_time, 2)
+        print(f"Translation connections warmed up in {self.stats['warm_up_time']}s")
+    
+    def get_stats(self) -> dict:
+        """Get call counters and I/O pool settings."""
+        return {
+            **self.stats,
+            "max_workers": self.max_workers,
+            "max_connections": self.max_connections,
+            "max_keepalive_connections": self.max_keepalive_connections,
+            "keepalive_expiry": self.keepalive_expiry,
+            "http2": self.http2,
+            "table_entries": len(self.translation_table) if self.translation_table else 0
+        }
+    
+    def lookup(self, text: str, target_lang: str, service: str) -> Optional[str]:
+        """Get a precomputed translation from the translation table, if any."""
+        if self.translation_table is None:
+            return None
+        translation = self.translation_table.get(text, target_lang, service)
+        if translation is not None:
+            self.stats["table_hits"] += 1
+        return translation
+    
+    async def close(self):
+        """Release pooled connections and worker threads."""
+        await self.http_client.aclose()
+        self.deepl_executor.shutdown(wait=False)
         
     async def translate_with_gpt(self, text: str, target_lang: str) -> Optional[str]:
         """Translate text using GPT-4."""
@@ -32,6 +160,7 @@ class TranslatorService:
             print("GPT client not initialized")
             return None
             
+        self.stats["gpt_calls"] += 1
         try:
             print(f"Translating with GPT-4: text='{text}', target_lang='{target_lang}'")
             response = await self.gpt_client.chat.completions.create(
@@ -52,6 +181,7 @@ class TranslatorService:
             print(f"GPT-4 translation result: {translation}")
             return translation
         except Exception as e:
+            self.stats["gpt_errors"] += 1
             print(f"Error translating with GPT-4: {e}")
             return None
     
@@ -61,12 +191,13 @@ class TranslatorService:
             print("DeepL client not initialized")
             return None
             
+        self.stats["deepl_calls"] += 1
         try:
             print(f"Translating with DeepL: text='{text}', target_lang='{target_lang}'")
-            # Run DeepL translation in a thread pool since it's synchronous
-            loop = asyncio.get_event_loop()
+            # Run DeepL translation in our own thread pool since it's synchronous
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
-                None,
+                self.deepl_executor,
                 lambda: self.deepl_client.translate_text(
                     text=text,
                     target_lang=target_lang
@@ -75,6 +206,7 @@ class TranslatorService:
             print(f"DeepL translation result: {result.text}")
             return result.text
         except Exception as e:
+            self.stats["deepl_errors"] += 1
             print(f"Error translating with DeepL: {e}")
             return None
     
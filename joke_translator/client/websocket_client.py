@@ -5,29 +5,40 @@ Simple WebSocket client for translating jokes.
 import asyncio
 import json
 import sys
+import os
 import websockets
-from typing import Dict
+from typing import Dict, Optional
+from urllib.parse import urlencode
 from .translator import TranslatorService
+from joke_translator.utils.translation_table import load_table
 
 class JokeTranslatorClient:
-    def __init__(self, uri: str = "ws://localhost:8000/ws"):
+    def __init__(self, uri: str = "ws://localhost:8000/ws", translation_table: Optional[str] = None):
         self.uri = uri
-        self.translator = TranslatorService()
+        self.translation_table = load_table(translation_table or os.getenv("TRANSLATION_TABLE"))
+        self.translator = TranslatorService(translation_table=self.translation_table)
         self.translations_completed = 0
         self.max_translations = 5
         self.active_translations: Dict[int, asyncio.Task] = {}
 
-    async def translate_and_send(self, websocket, joke_id: int, joke_text: str, target_lang: str, translation_service: str):
+    async def translate_and_send(self, websocket, joke_id: int, joke_text: str, target_lang: str, translation_service: str,
+                                 precomputed: Optional[str] = None):
         """Translate a joke and send it back to the server."""
         try:
-            # Translate the joke
-            translated_text = await self.translator.translate(joke_text, target_lang, translation_service)
+            # Use a precomputed translation from the server or our own table when there is one
+            translated_text = precomputed or self.translator.lookup(joke_text, target_lang, translation_service)
+            source = "table" if translated_text else "provider"
+            if not translated_text:
+                translated_text = await self.translator.translate(joke_text, target_lang, translation_service)
             if translated_text:
                 # Send translation back to server
                 response = {
                     "type": "translation_complete",
                     "id": joke_id,
-                    "translated_joke": translated_text
+                    "translated_joke": translated_text,
+                    "target_lang": target_lang,
+                    "service": translation_service,
+                    "source": source
                 }
                 await websocket.send(json.dumps(response))
                 
@@ -50,8 +61,11 @@ class JokeTranslatorClient:
 
     async def run(self, target_lang: str = "de", translation_service: str = "deepl"):
         """Run the client until max translations are reached."""
+        await self.translator.warm_up()
         try:
-            async with websockets.connect(self.uri) as websocket:
+            # Tell the server what we translate into so it can send precomputed translations
+            uri = f"{self.uri}?{urlencode({'lang': target_lang, 'service': translation_service})}"
+            async with websockets.connect(uri) as websocket:
                 print(f"Connected to server at {self.uri}")
                 
                 while self.translations_completed < self.max_translations:
@@ -70,7 +84,10 @@ class JokeTranslatorClient:
                                 
                                 # Create and track translation task
                                 task = asyncio.create_task(
-                                    self.translate_and_send(websocket, joke_id, joke_text, target_lang, translation_service)
+                                    self.translate_and_send(
+                                        websocket, joke_id, joke_text, target_lang, translation_service,
+                                        precomputed=data.get("translation")
+                                    )
                                 )
                                 self.active_translations[joke_id] = task
                                 
@@ -101,6 +118,9 @@ class JokeTranslatorClient:
                 
         except Exception as e:
             print(f"Connection error: {e}")
+        finally:
+            print(f"Translator stats: {self.translator.get_stats()}")
+            await self.translator.close()
 
     def start(self, target_lang: str = "de", translation_service: str = "deepl"):
         """Start the client in the current event loop."""
@@ -4,6 +4,7 @@ FastAPI application module for the Joke Translator server.
 
 import os
 import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
@@ -13,9 +14,21 @@ from fastapi.responses import HTMLResponse
 
 from joke_translator.server.manager import ConnectionManager
 from joke_translator.utils.joke_generator import JokeGenerator
+from joke_translator.utils.results_sink import TranslationSink
+from joke_translator.utils.translation_table import load_table
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the translation results sink for the lifetime of the server."""
+    if results_sink is not None:
+        await results_sink.start()
+    yield
+    # Flush any buffered translation records before exiting
+    if results_sink is not None:
+        await results_sink.stop()
 
 # Initialize FastAPI app
-app = FastAPI(title="Joke Translator")
+app = FastAPI(title="Joke Translator", lifespan=lifespan)
 
 # Set up static files and templates
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -26,10 +39,13 @@ app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
 templates = Jinja2Templates(directory=str(TEMPLATES_DIR))
 
 # Initialize managers
-connection_manager = ConnectionManager()
+results_dir = os.getenv("RESULTS_DIR", "translations")
+results_sink = TranslationSink(results_dir) if results_dir else None
+connection_manager = ConnectionManager(results_sink=results_sink)
 joke_generator = JokeGenerator()
+translation_table = load_table(os.getenv("TRANSLATION_TABLE", "translations.jtt"))
 
-async def send_jokes(websocket: WebSocket):
+async def send_jokes(websocket: WebSocket, target_lang: Optional[str] = None, service: Optional[str] = None):
     """Send jokes to the client every 200ms."""
     try:
         while True:
@@ -38,7 +54,10 @@ async def send_jokes(websocket: WebSocket):
                 break
                 
             joke_id, joke = joke_generator.get_joke()
-            await connection_manager.send_joke(websocket, joke_id, joke)
+            translation = None
+            if translation_table is not None and target_lang and service:
+                translation = translation_table.get(joke, target_lang, service)
+            await connection_manager.send_joke(websocket, joke_id, joke, translation)
             await asyncio.sleep(0.2)  # 200ms delay
     except Exception as e:
         print(f"Error sending jokes: {e}")
@@ -49,7 +68,11 @@ async def websocket_endpoint(websocket: WebSocket):
     await connection_manager.connect(websocket)
     try:
         # Start sending jokes asynchronously
-        joke_task = asyncio.create_task(send_jokes(websocket))
+        joke_task = asyncio.create_task(send_jokes(
+            websocket,
+            websocket.query_params.get("lang"),
+            websocket.query_params.get("service")
+        ))
         
         # Handle translation completion messages
         while True:
@@ -57,7 +80,14 @@ async def websocket_endpoint(websocket: WebSocket):
             if data.get("type") == "translation_complete":
                 joke_id = data.get("id")
                 if joke_id is not None:
-                    connection_manager.record_translation(websocket, joke_id)
+                    connection_manager.record_translation(
+                        websocket,
+                        joke_id,
+                        translated_joke=data.get("translated_joke"),
+                        target_lang=data.get("target_lang"),
+                        service=data.get("service"),
+                        source=data.get("source")
+                    )
                     # Check if client has completed 5 translations
                     if connection_manager.get_client_translations(websocket) >= 5:
                         break
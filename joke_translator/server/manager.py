@@ -4,18 +4,25 @@ Connection manager for WebSocket connections and statistics tracking.
 
 import asyncio
 import time
-from typing import Dict, Set
+from typing import Dict, Optional, Set
 from fastapi import WebSocket
 
+from joke_translator.utils.results_sink import TranslationSink
+
 class ConnectionManager:
     """Manages WebSocket connections and tracks statistics."""
     
-    def __init__(self):
+    def __init__(self, results_sink: Optional[TranslationSink] = None):
         self.active_connections: Set[WebSocket] = set()
         self.connection_stats: Dict[WebSocket, dict] = {}
         self.dashboard_connections: Set[WebSocket] = set()
         # Track pending translations with their start times
         self.pending_translations: Dict[int, float] = {}  # joke_id -> start_time
+        # Per-connection joke text and table-translated joke_ids, dropped on disconnect
+        self.pending_jokes: Dict[WebSocket, Dict[int, str]] = {}
+        self.precomputed_jokes: Dict[WebSocket, Set[int]] = {}
+        # Optional durable store for completed translations
+        self.results_sink = results_sink
         # Global statistics that persist across client disconnections
         self.global_stats = {
             "total_jokes_sent": 0,
@@ -34,6 +41,8 @@ class ConnectionManager:
             "translations_received": 0,
             "translation_times": []
         }
+        self.pending_jokes[websocket] = {}
+        self.precomputed_jokes[websocket] = set()
         self.global_stats["total_clients_served"] += 1
         if self.global_stats["session_start_time"] is None:
             self.global_stats["session_start_time"] = time.time()
@@ -51,38 +60,75 @@ class ConnectionManager:
             self.active_connections.remove(websocket)
             if websocket in self.connection_stats:
                 del self.connection_stats[websocket]
+            self.pending_jokes.pop(websocket, None)
+            self.precomputed_jokes.pop(websocket, None)
             await self.broadcast_stats()
         elif websocket in self.dashboard_connections:
             self.dashboard_connections.remove(websocket)
     
-    async def send_joke(self, websocket: WebSocket, joke_id: int, joke: str):
+    async def send_joke(self, websocket: WebSocket, joke_id: int, joke: str, translation: Optional[str] = None):
         """Send a joke to a client and start tracking its translation time."""
         message = {"id": joke_id, "joke": joke}
+        if translation is not None:
+            message["translation"] = translation
+            self.precomputed_jokes[websocket].add(joke_id)
         await websocket.send_json(message)
         self.connection_stats[websocket]["jokes_sent"] += 1
         self.global_stats["total_jokes_sent"] += 1
         self.pending_translations[joke_id] = time.time()
+        self.pending_jokes[websocket][joke_id] = joke
         await self.broadcast_stats()
     
-    def record_translation(self, websocket: WebSocket, joke_id: int):
+    def record_translation(
+        self,
+        websocket: WebSocket,
+        joke_id: int,
+        translated_joke: Optional[str] = None,
+        target_lang: Optional[str] = None,
+        service: Optional[str] = None,
+        source: Optional[str] = None
+    ):
         """Record the translation time for a joke."""
         if joke_id in self.pending_translations:
-            translation_time = time.time() - self.pending_translations[joke_id]
+            sent_at = self.pending_translations[joke_id]
+            completed_at = time.time()
+            translation_time = completed_at - sent_at
             translation_time = round(translation_time, 2)  # Round to 2 decimal places
+            # Table lookups finish almost instantly, so keep them out of the latency stats
+            client_jokes = self.pending_jokes.get(websocket, {})
+            client_precomputed = self.precomputed_jokes.get(websocket, set())
+            precomputed = source == "table" or joke_id in client_precomputed
             
             stats = self.connection_stats[websocket]
             stats["translations_received"] += 1
-            stats["translation_times"].append(translation_time)
+            if not precomputed:
+                stats["translation_times"].append(translation_time)
             
             # Update global statistics
             self.global_stats["total_translations"] += 1
-            self.global_stats["translation_history"].append((time.time(), translation_time))
+            if not precomputed:
+                self.global_stats["translation_history"].append((time.time(), translation_time))
             
             # Keep only the last 100 translations in history to manage memory
             if len(self.global_stats["translation_history"]) > 100:
                 self.global_stats["translation_history"] = self.global_stats["translation_history"][-100:]
             
+            if self.results_sink is not None:
+                self.results_sink.record({
+                    "joke_id": joke_id,
+                    "joke": client_jokes.get(joke_id),
+                    "language": target_lang,
+                    "service": service,
+                    "translation": translated_joke,
+                    "source": "table" if precomputed else "provider",
+                    "sent_at": sent_at,
+                    "completed_at": completed_at,
+                    "duration": round(completed_at - sent_at, 4)
+                })
+            
             del self.pending_translations[joke_id]
+            client_jokes.pop(joke_id, None)
+            client_precomputed.discard(joke_id)
             asyncio.create_task(self.broadcast_stats())
     
     async def broadcast_stats(self):
@@ -120,7 +166,8 @@ class ConnectionManager:
                 },
                 "total_clients_served": self.global_stats["total_clients_served"],
                 "session_duration": session_duration,
-                "active_clients": len(self.active_connections)
+                "active_clients": len(self.active_connections),
+                "results_sink": self.results_sink.get_stats() if self.results_sink is not None else None
             }
         }
         
@@ -0,0 +1,75 @@
+"""
+Module for precomputing translations of the static joke corpus.
+"""
+
+import asyncio
+from typing import Dict, List
+
+from joke_translator.client.translator import TranslatorService
+from joke_translator.utils.translation_table import load_table, make_key, write_table
+
+async def precompute_translations(
+    jokes: List[str],
+    languages: List[str],
+    services: List[str],
+    output_path: str,
+    concurrency: int = 4
+) -> Dict[str, int]:
+    """Translate every joke into each language/service pair and write a translation table.
+
+    Entries already in an existing table at output_path are kept and not
+    re-translated; entries for jokes no longer in the corpus are dropped.
+    """
+    if concurrency < 1:
+        raise ValueError(f"Concurrency must be at least 1, got {concurrency}")
+
+    # Work out which entries the corpus needs
+    wanted = {}
+    for joke in jokes:
+        for language in languages:
+            for service in services:
+                wanted[make_key(joke, language, service)] = (joke, language, service)
+
+    # A missing or unreadable table just means everything gets translated
+    entries: Dict[bytes, str] = {}
+    existing = load_table(output_path)
+    if existing is not None:
+        try:
+            entries = {key: text for key, text in existing.items() if key in wanted}
+        except Exception as e:
+            print(f"Error reading translation table, rebuilding it: {e}")
+            entries = {}
+        finally:
+            existing.close()
+
+    missing = [(key, job) for key, job in wanted.items() if key not in entries]
+    print(f"{len(entries)} translations up to date, {len(missing)} to translate")
+
+    translator = TranslatorService(max_workers=concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    failed = 0
+
+    async def translate_one(key: bytes, joke: str, language: str, service: str):
+        nonlocal failed
+        async with semaphore:
+            translation = await translator.translate(joke, language, service)
+        if translation:
+            entries[key] = translation
+        else:
+            failed += 1
+
+    try:
+        if missing:
+            await translator.warm_up()
+            await asyncio.gather(*(translate_one(key, *job) for key, job in missing))
+    finally:
+        await translator.close()
+
+    write_table(output_path, entries)
+    print(f"Wrote {len(entries)} translations to {output_path}")
+    return {
+        "entries": len(entries),
+        "translated": len(missing) - failed,
+        "failed": failed,
+        "skipped": len(wanted) - len(missing)
+    }
@@ -0,0 +1,144 @@
+"""
+Module for persisting completed translations to an append-only local store.
+"""
+
+import os
+import json
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional
+
+SEGMENT_PREFIX = "translations-"
+SEGMENT_SUFFIX = ".jsonl"
+
+def _segment_name(index: int) -> str:
+    """Build the file name for a segment index."""
+    return f"{SEGMENT_PREFIX}{index:06d}{SEGMENT_SUFFIX}"
+
+def _segment_indexes(directory: str) -> List[int]:
+    """List the segment indexes present in a directory, oldest first."""
+    if not os.path.isdir(directory):
+        return []
+    indexes = []
+    for name in os.listdir(directory):
+        if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+            number = name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]
+            if number.isdigit():
+                indexes.append(int(number))
+    return sorted(indexes)
+
+class TranslationSink:
+    """Buffers translation records and appends them to rotating JSON Lines files."""
+
+    def __init__(
+        self,
+        directory: str = "translations",
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        max_file_bytes: int = 10 * 1024 * 1024
+    ):
+        self.directory = directory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_file_bytes = max_file_bytes
+        self.buffer: List[dict] = []
+        self.records_written = 0
+        self.dropped_batches = 0
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._stopping = False
+        # A single writer thread keeps batches in order and off the event loop;
+        # created in start() so the sink can be restarted after stop()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        existing = _segment_indexes(directory)
+        self._segment_index = existing[-1] if existing else 1
+
+    async def start(self):
+        """Start the background flush task."""
+        if self._flush_task is None:
+            self._stopping = False
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="results-sink")
+            self._flush_event = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            print(f"Persisting translations to {self.directory}")
+
+    async def stop(self):
+        """Stop the background task and flush anything still buffered."""
+        if self._flush_task is not None:
+            # Let the loop finish any write in progress rather than cancelling it
+            self._stopping = True
+            self._flush_event.set()
+            await self._flush_task
+            self._flush_task = None
+        await self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def record(self, record: dict):
+        """Queue a record for the next flush. Never blocks."""
+        self.buffer.append(record)
+        if len(self.buffer) >= self.batch_size and self._flush_event is not None:
+            self._flush_event.set()
+
+    async def flush(self):
+        """Write all buffered records to disk."""
+        if not self.buffer or self._executor is None:
+            return
+        batch, self.buffer = self.buffer, []
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self._write_batch, batch)
+            self.records_written += len(batch)
+        except Exception as e:
+            self.dropped_batches += 1
+            print(f"Error writing translation records: {e}")
+
+    async def _flush_loop(self):
+        """Flush whenever a batch fills up or the flush interval elapses."""
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._flush_event.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_event.clear()
+            if self._stopping:
+                break
+            await self.flush()
+
+    def _write_batch(self, batch: List[dict]):
+        """Append a batch to the current segment, rotating when it gets too large."""
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, _segment_name(self._segment_index))
+        if os.path.exists(path) and os.path.getsize(path) >= self.max_file_bytes:
+            self._segment_index += 1
+            path = os.path.join(self.directory, _segment_name(self._segment_index))
+
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in batch)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def get_stats(self) -> dict:
+        """Get write counters for the sink."""
+        return {
+            "records_written": self.records_written,
+            "records_buffered": len(self.buffer),
+            "dropped_batches": self.dropped_batches,
+            "current_segment": _segment_name(self._segment_index)
+        }
+
+def read_records(directory: str = "translations") -> Iterator[dict]:
+    """Lazily yield every stored translation record, oldest first."""
+    for index in _segment_indexes(directory):
+        path = os.path.join(directory, _segment_name(index))
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A partially written last line after a crash; skip it
+                    continue
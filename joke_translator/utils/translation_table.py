@@ -0,0 +1,145 @@
+"""
+Module for reading and writing precomputed translation tables.
+
+A table is a single file that can be memory-mapped:
+    header  - magic (4 bytes) + entry count (uint32) + CRC32 of index and data (uint32)
+    index   - entries sorted by key: key (16 bytes) + offset (uint64) + length (uint32)
+    data    - UTF-8 translations, referenced by the index
+Keys are derived from the service, language and joke text, so a changed
+joke gets a new key and is picked up as missing on the next precompute.
+Tables that fail validation are rejected on load so they get rebuilt.
+"""
+
+import os
+import mmap
+import struct
+import zlib
+import hashlib
+from typing import Dict, Iterator, Optional, Tuple
+
+MAGIC = b"JTT2"
+HEADER = struct.Struct("<4sII")
+ENTRY = struct.Struct("<16sQI")
+
+def make_key(joke: str, target_lang: str, service: str) -> bytes:
+    """Build the index key for a joke translation."""
+    raw = f"{service}\n{target_lang.lower()}\n{joke}".encode("utf-8")
+    return hashlib.sha1(raw).digest()[:16]
+
+def write_table(path: str, entries: Dict[bytes, str]):
+    """Write a translation table atomically, replacing any existing file."""
+    keys = sorted(entries)
+    data_start = HEADER.size + ENTRY.size * len(keys)
+    index = bytearray()
+    data = bytearray()
+    for key in keys:
+        encoded = entries[key].encode("utf-8")
+        index += ENTRY.pack(key, data_start + len(data), len(encoded))
+        data += encoded
+
+    checksum = zlib.crc32(data, zlib.crc32(index))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, len(keys), checksum))
+        f.write(index)
+        f.write(data)
+    os.replace(tmp_path, path)
+
+class TranslationTable:
+    """Memory-mapped, read-only view of a precomputed translation table."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            self._file.close()
+            raise ValueError(f"Translation table is empty: {path}")
+        try:
+            self._validate()
+        except ValueError:
+            self.close()
+            raise
+
+    def _validate(self):
+        """Check the header, checksum and every index entry against the file."""
+        size = len(self._mmap)
+        if size < HEADER.size:
+            raise ValueError(f"Translation table is truncated: {self.path}")
+        magic, self.count, checksum = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a translation table: {self.path}")
+        data_start = HEADER.size + self.count * ENTRY.size
+        if size < data_start:
+            raise ValueError(f"Translation table is truncated: {self.path}")
+        if zlib.crc32(self._mmap[HEADER.size:]) != checksum:
+            raise ValueError(f"Translation table checksum mismatch: {self.path}")
+
+        previous_key = None
+        for position in range(self.count):
+            key, offset, length = self._entry(position)
+            if offset < data_start or offset + length > size:
+                raise ValueError(f"Translation table entry {position} is out of bounds: {self.path}")
+            if previous_key is not None and key <= previous_key:
+                raise ValueError(f"Translation table index is not sorted: {self.path}")
+            previous_key = key
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _entry(self, position: int) -> Tuple[bytes, int, int]:
+        return ENTRY.unpack_from(self._mmap, HEADER.size + position * ENTRY.size)
+
+    def _find(self, key: bytes) -> Optional[Tuple[int, int]]:
+        """Binary search the index for a key."""
+        low, high = 0, self.count - 1
+        while low <= high:
+            middle = (low + high) // 2
+            entry_key, offset, length = self._entry(middle)
+            if entry_key == key:
+                return offset, length
+            if entry_key < key:
+                low = middle + 1
+            else:
+                high = middle - 1
+        return None
+
+    def get(self, joke: str, target_lang: str, service: str) -> Optional[str]:
+        """Look up the precomputed translation for a joke."""
+        return self.get_by_key(make_key(joke, target_lang, service))
+
+    def get_by_key(self, key: bytes) -> Optional[str]:
+        """Look up a translation by its index key."""
+        found = self._find(key)
+        if found is None:
+            return None
+        offset, length = found
+        try:
+            return self._mmap[offset:offset + length].decode("utf-8")
+        except UnicodeDecodeError:
+            return None
+
+    def items(self) -> Iterator[Tuple[bytes, str]]:
+        """Yield every (key, translation) pair in index order."""
+        for position in range(self.count):
+            key, offset, length = self._entry(position)
+            yield key, self._mmap[offset:offset + length].decode("utf-8")
+
+    def close(self):
+        """Unmap the table and close the file."""
+        self._mmap.close()
+        self._file.close()
+
+def load_table(path: Optional[str]) -> Optional[TranslationTable]:
+    """Open a translation table if one exists at the given path."""
+    if not path or not os.path.exists(path):
+        return None
+    try:
+        table = TranslationTable(path)
+        print(f"Loaded {len(table)} precomputed translations from {path}")
+        return table
+    except Exception as e:
+        print(f"Error loading translation table: {e}")
+        return None
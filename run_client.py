@@ -38,6 +38,11 @@ def main():
         default="de",
         help="Target language code (default: de)"
     )
+    parser.add_argument(
+        "--translation-table",
+        default=None,
+        help="Precomputed translation table to check before calling a provider"
+    )
     parser.add_argument(
         "--gpt",
         action="store_true",
@@ -48,7 +53,8 @@ def main():
     
     # Create and run the client
     client = JokeTranslatorClient(
-        uri=f"ws://{args.host}:{args.port}/ws"
+        uri=f"ws://{args.host}:{args.port}/ws",
+        translation_table=args.translation_table
     )
     
     # Determine translation service
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Script to precompute translations for the static joke corpus.
+"""
+
+import argparse
+import asyncio
+import os
+from dotenv import load_dotenv
+from joke_translator.utils.joke_generator import JokeGenerator
+from joke_translator.utils.precompute import precompute_translations
+
+def main():
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Precompute translations for jokes.json")
+    parser.add_argument(
+        "--languages",
+        default="de",
+        help="Comma-separated target language codes (default: de)"
+    )
+    parser.add_argument(
+        "--services",
+        default="deepl",
+        help="Comma-separated translation services, deepl and/or gpt (default: deepl)"
+    )
+    parser.add_argument(
+        "--output",
+        default="translations.jtt",
+        help="Translation table to write (default: translations.jtt)"
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Maximum translations in flight (default: 4)"
+    )
+
+    args = parser.parse_args()
+
+    # Always precompute from the static corpus
+    os.environ.pop("USE_GPT4_JOKES", None)
+    jokes = JokeGenerator().jokes
+
+    languages = [lang.strip() for lang in args.languages.split(",") if lang.strip()]
+    services = [service.strip() for service in args.services.split(",") if service.strip()]
+    for service in services:
+        if service not in ("deepl", "gpt"):
+            parser.error(f"Unsupported translation service: {service}")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    result = asyncio.run(precompute_translations(
+        jokes,
+        languages,
+        services,
+        args.output,
+        concurrency=args.concurrency
+    ))
+    print(f"Translated: {result['translated']}, skipped: {result['skipped']}, failed: {result['failed']}")
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,16 @@ def main():
         default=8000,
         help="Port to bind the server to (default: 8000)"
     )
+    parser.add_argument(
+        "--results-dir",
+        default=None,
+        help="Directory for persisted translation records (default: translations, empty to disable)"
+    )
+    parser.add_argument(
+        "--translation-table",
+        default=None,
+        help="Precomputed translation table to serve from (default: translations.jtt)"
+    )
     parser.add_argument(
         "--reload",
         action="store_true",
@@ -42,6 +52,14 @@ def main():
     if args.gpt:
         os.environ["USE_GPT4_JOKES"] = "1"
     
+    # Set environment variable for the translation results store
+    if args.results_dir is not None:
+        os.environ["RESULTS_DIR"] = args.results_dir
+    
+    # Set environment variable for the precomputed translation table
+    if args.translation_table is not None:
+        os.environ["TRANSLATION_TABLE"] = args.translation_table
+    
     # Run the server
     uvicorn.run(
         "joke_translator.server.app:app",